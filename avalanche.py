@@ -14,13 +14,17 @@ debt, and interest is accrued on all outstanding debts at the end of the day.
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
 from typing import Iterable, List, Optional, Tuple
 from calendar import monthrange
+from bisect import bisect_right
 
-from cash_flow import projected_min_balance
+from cash_flow import _flow_key, _to_dec, min_running_balance
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a financial event."""
 
@@ -29,9 +33,10 @@ class Event:
     amount: Decimal
     name: str
     debt: Optional[str] = None
+    debt_idx: Optional[int] = None  # position of ``debt`` in the debts list
 
 
-@dataclass
+@dataclass(slots=True)
 class Debt:
     """Represents a debt with APR and balance."""
 
@@ -48,13 +53,78 @@ class Debt:
 # Helpers
 
 
+_DATE_KEY = attrgetter("date")
+_APR_KEY = attrgetter("apr")
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0")
+
+
 def _parse_date(value: date | str) -> date:
     if isinstance(value, date):
         return value
     return datetime.strptime(value, "%Y-%m-%d").date()
 
 
+def _to_cents(value: Decimal | int | float | str) -> Decimal:
+    """Convert an input amount to ``Decimal`` rounded to whole cents."""
+
+    return _to_dec(value).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _sanitize_inputs(
+    paychecks: Iterable[dict],
+    bills: Iterable[dict],
+    goals: Iterable[dict],
+    debts_input: Iterable[dict],
+) -> Tuple[List[dict], List[dict], List[dict], List[Debt]]:
+    """Normalize raw inputs once at the simulation boundary.
+
+    Amounts are returned as ``Decimal`` values rounded to cents and dates as
+    ``date`` objects, so nothing downstream needs to convert them again.
+    Debts are returned as ``Debt`` objects; APRs are kept at full precision.
+    """
 
+    norm_paychecks = [
+        {
+            "name": p.get("name", "Paycheck"),
+            "amount": _to_cents(p["amount"]),
+            "date": _parse_date(p["date"]),
+            "frequency": p.get("frequency", "monthly").lower(),
+        }
+        for p in paychecks
+    ]
+    norm_bills = []
+    for b in bills:
+        bill = {
+            "name": b.get("name", "Bill"),
+            "amount": _to_cents(b["amount"]),
+            "date": _parse_date(b["date"]),
+        }
+        if "debt" in b:
+            bill["debt"] = b["debt"]
+        norm_bills.append(bill)
+    norm_goals = [
+        {
+            "name": g.get("name", "Goal"),
+            "amount": _to_cents(g["amount"]),
+            "date": _parse_date(g["date"]),
+        }
+        for g in goals
+    ]
+    debts = [
+        Debt(
+            name=d["name"],
+            balance=_to_cents(d["balance"]),
+            apr=_to_dec(d["apr"]),
+            minimum_payment=_to_cents(d.get("minimum_payment", 0)),
+            due_date=_parse_date(d["due_date"]) if d.get("due_date") else None,
+        )
+        for d in debts_input
+    ]
+    return norm_paychecks, norm_bills, norm_goals, debts
+
+
+@lru_cache(maxsize=4096)
 def _add_month(d: date) -> date:
     """Return a date one month after ``d`` preserving month length."""
 
@@ -64,6 +134,30 @@ def _add_month(d: date) -> date:
     return date(year, month, day)
 
 
+# Paycheck frequencies with a fixed period, in days
+_FIXED_STEPS = {"weekly": 7, "biweekly": 14}
+
+
+def _month_step_after(d: date, after: date) -> date:
+    """Return the first date after ``after`` in the monthly series from ``d``.
+
+    Equivalent to repeatedly applying :func:`_add_month`. Clamping only ever
+    lowers the day, and the first non-leap February brings a day of 29-31
+    down to 28, so at most a couple of years are walked month by month. Once
+    the day is 28 or less no month clamps it and the target month is
+    computed directly.
+    """
+
+    while d.day > 28 and d <= after:
+        d = _add_month(d)
+    if d > after:
+        return d
+    months = (after.year - d.year) * 12 + after.month - d.month
+    years, month = divmod(d.month - 1 + months, 12)
+    current = date(d.year + years, month + 1, d.day)
+    return current if current > after else _add_month(current)
+
+
 def _advance_paycheck(current: date, freq: str, first_day: int) -> date:
     """Return the next paycheck date based on ``freq`` starting from ``current``."""
 
@@ -86,16 +180,40 @@ def _build_events(
     paychecks: Iterable[dict],
     bills: Iterable[dict],
     goals: Iterable[dict],
-    debts: Iterable[Debt],
+    debts: List[Debt],
     start: date,
     end: date,
 ) -> List[Event]:
+    """Expand sanitized inputs into dated events between ``start`` and ``end``."""
+
     events: List[Event] = []
+    # Later entries win on duplicate names, as with a name-keyed dict
+    debt_index = {d.name: idx for idx, d in enumerate(debts)}
+    # Monthly series are rolled forward to their first date on or after start
+    before_start = start - timedelta(days=1)
 
     # Generate recurring paychecks
     for p in paychecks:
-        current = _parse_date(p["date"])
-        freq = p.get("frequency", "monthly").lower()
+        current = p["date"]
+        freq = p["frequency"]
+        amount = p["amount"]
+        step = _FIXED_STEPS.get(freq)
+        if step is not None:
+            # Fixed-length periods: jump straight to the first date on or
+            # after ``start`` and walk the ordinals with a C-level range.
+            first = current.toordinal()
+            if first < start.toordinal():
+                first += -((first - start.toordinal()) // step) * step
+            events.extend(
+                Event(
+                    date=date.fromordinal(o),
+                    type="paycheck",
+                    amount=amount,
+                    name=p["name"],
+                )
+                for o in range(first, end.toordinal() + 1, step)
+            )
+            continue
         first_day = current.day
         while current < start:
             current = _advance_paycheck(current, freq, first_day)
@@ -104,26 +222,28 @@ def _build_events(
                 Event(
                     date=current,
                     type="paycheck",
-                    amount=Decimal(str(p["amount"])),
-                    name=p.get("name", "Paycheck"),
+                    amount=amount,
+                    name=p["name"],
                 )
             )
             current = _advance_paycheck(current, freq, first_day)
 
     # Recurring bills
     for b in bills:
-        current = _parse_date(b["date"])
-        while current < start:
-            current = _add_month(current)
+        current = b["date"]
+        amount = b["amount"]
+        debt_idx = debt_index[b["debt"]] if "debt" in b else None
+        current = _month_step_after(current, before_start)
         while current <= end:
             if "debt" in b:
                 events.append(
                     Event(
                         date=current,
                         type="debt_add",
-                        amount=Decimal(str(b["amount"])),
-                        name=b.get("name", "Bill"),
+                        amount=amount,
+                        name=b["name"],
                         debt=b["debt"],
+                        debt_idx=debt_idx,
                     )
                 )
             else:
@@ -131,22 +251,22 @@ def _build_events(
                     Event(
                         date=current,
                         type="bill",
-                        amount=Decimal(str(b["amount"])),
-                        name=b.get("name", "Bill"),
+                        amount=amount,
+                        name=b["name"],
                     )
                 )
             current = _add_month(current)
 
     # One-time goals
     for g in goals:
-        goal_date = _parse_date(g["date"])
+        goal_date = g["date"]
         if start <= goal_date <= end:
             events.append(
                 Event(
                     date=goal_date,
                     type="goal",
-                    amount=Decimal(str(g["amount"])),
-                    name=g.get("name", "Goal"),
+                    amount=g["amount"],
+                    name=g["name"],
                 )
             )
 
@@ -154,9 +274,8 @@ def _build_events(
     for d in debts:
         if d.due_date is None or d.minimum_payment <= 0:
             continue
-        current = d.due_date
-        while current < start:
-            current = _add_month(current)
+        debt_idx = debt_index[d.name]
+        current = _month_step_after(d.due_date, before_start)
         while current <= end:
             events.append(
                 Event(
@@ -165,21 +284,26 @@ def _build_events(
                     d.minimum_payment,
                     d.name,
                     debt=d.name,
+                    debt_idx=debt_idx,
                 )
             )
             current = _add_month(current)
 
-    events.sort(key=lambda e: e.date)
+    events.sort(key=_DATE_KEY)
     return events
 
 
 def _next_due_date(due: Optional[date], end: date) -> Optional[date]:
     if due is None:
         return None
-    current = due
-    while current <= end:
-        current = _add_month(current)
-    return current
+    return _month_step_after(due, end)
+
+
+@lru_cache(maxsize=None)
+def _apr_factors(apr: Decimal) -> Tuple[Decimal, Decimal]:
+    """Return the daily interest rate and minimum-payment factor for ``apr``."""
+
+    return apr / Decimal("36500"), apr / Decimal("1200") + _CENT
 
 
 def compute_min_payment(debt: Debt, as_of: date) -> Decimal:
@@ -192,16 +316,19 @@ def compute_min_payment(debt: Debt, as_of: date) -> Decimal:
     """
 
     balance = debt.balance
+    if not debt.apr:
+        # No interest to project or add: the estimate is 1% of the balance
+        return (balance * _CENT).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+    daily_rate, monthly_factor = _apr_factors(debt.apr)
     if debt.due_date and debt.apr > 0:
-        next_due = debt.due_date
-        while next_due <= as_of:
-            next_due = _add_month(next_due)
-        days = (next_due - as_of).days
+        next_due = _month_step_after(debt.due_date, as_of)
+        days = next_due.toordinal() - as_of.toordinal()
         if days > 0:
-            balance += balance * debt.apr / Decimal("36500") * days
+            balance += balance * daily_rate * days
 
-    base = balance * (debt.apr / Decimal("1200") + Decimal("0.01"))
-    return base.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    base = balance * monthly_factor
+    return base.quantize(_CENT, rounding=ROUND_HALF_UP)
 
 
 # ---------------------------------------------------------------------------
@@ -242,7 +369,8 @@ def daily_avalanche_schedule(
         ``schedule`` of transactions, a list of ``debts`` with updated balances and
         either a ``next_due_date`` for outstanding debts or a ``paid_off_date`` for debts
         that have been fully repaid, and ``negative_date`` which is the first date the
-        balance dropped below zero when ``debug`` is enabled.
+        balance dropped below zero when ``debug`` is enabled. ``schedule`` rows
+        are emitted in chronological order.
 
     Raises
     ------
@@ -252,71 +380,75 @@ def daily_avalanche_schedule(
     When ``debug`` is True the schedule continues even if the balance would
     become negative and the first date the balance drops below zero is
     returned as ``negative_date``.
+
+    Monetary inputs are rounded to whole cents before the simulation starts.
     """
 
-    balance = Decimal(str(starting_balance))
+    balance = _to_cents(starting_balance)
 
     start = date.today()
     end = start + timedelta(days=days)
     lookahead_end = max(end, start + timedelta(days=365))
 
-    # Prepare debt objects for tracking balances and APRs
-    debts: List[Debt] = [
-        Debt(
-            name=d["name"],
-            balance=Decimal(str(d["balance"])),
-            apr=Decimal(str(d["apr"])),
-            minimum_payment=Decimal(str(d.get("minimum_payment", 0))),
-            due_date=_parse_date(d["due_date"]) if d.get("due_date") else None,
-        )
-        for d in debts_input
+    # Normalize inputs once; debts become objects tracking balances and APRs
+    paychecks, bills, goals, debts = _sanitize_inputs(
+        paychecks, bills, goals, debts_input
+    )
+    # APRs never change, so the avalanche order is fixed up front. The stable
+    # sort keeps input order for equal APRs, matching ``max`` tie-breaking.
+    avalanche_order = sorted(debts, key=_APR_KEY, reverse=True)
+    # Only debts with a positive APR ever accrue interest; APRs are fixed, so
+    # each debt's daily rate is computed once
+    accruing = [
+        (idx, d, _apr_factors(d.apr)[0]) for idx, d in enumerate(debts) if d.apr > 0
     ]
-    debt_lookup = {d.name: d for d in debts}
 
     events = _build_events(paychecks, bills, goals, debts, start, lookahead_end)
 
+    # Without debts nothing is paid down early and the event list is never
+    # modified, so the overdraft lookahead can be answered from running totals
+    # computed once. Flows are ordered like ``projected_min_balance`` orders
+    # them: by date, incomes before bills.
+    flows: List[Tuple[date, Decimal]] = []
+    totals: List[Decimal] = []
+    suffix_min: List[Decimal] = []
+    k = 0
+    if not debts:
+        flows = [(ev.date, -ev.amount) for ev in events if ev.type != "paycheck"]
+        flows += [(ev.date, ev.amount) for ev in events if ev.type == "paycheck"]
+        flows.sort(key=_flow_key)
+        totals = list(accumulate((amount for _, amount in flows), initial=_ZERO))
+        suffix_min = list(accumulate(reversed(totals), min))[::-1]
+
     schedule: List[dict] = []
     negative_hit: Optional[date] = None
 
     current_date = start
     i = 0
     while current_date <= end:
-        paychecks_today: List[Event] = []
-        others_today: List[Event] = []
-        while i < len(events) and events[i].date == current_date:
-            ev = events[i]
-            if ev.type == "paycheck":
-                paychecks_today.append(ev)
-            else:
-                others_today.append(ev)
-            i += 1
-
-        # Process income first
-        for ev in paychecks_today:
-            balance += ev.amount
-            schedule.append(
-                {
-                    "date": ev.date,
-                    "type": "paycheck",
-                    "description": ev.name,
-                    "amount": ev.amount,
-                    "balance": balance,
-                }
-            )
-
-        # Then pay bills or minimum debt payments for the day
+        # ``events`` gains inserted minimum payments as the day is processed,
+        # so today's group is sliced off by index rather than iterated lazily.
+        day_end = bisect_right(events, current_date, lo=i, key=_DATE_KEY)
+        todays = events[i:day_end]
+        i = day_end
+        paychecks_today = [ev for ev in todays if ev.type == "paycheck"]
+        others_today = [ev for ev in todays if ev.type != "paycheck"]
+
+        # Income is applied first, then bills or minimum debt payments. Each
+        # row records its cash delta so the day's balance is updated once.
+        day_rows: List[Tuple[Event, Decimal, Decimal]] = [
+            (ev, ev.amount, ev.amount) for ev in paychecks_today
+        ]
         for ev in others_today:
             if ev.type == "debt_add":
-                debt = debt_lookup[ev.debt]
+                debt = debts[ev.debt_idx]
                 debt.balance += ev.amount
 
                 # Recompute the minimum payment after the additional charge
                 new_min = compute_min_payment(debt, current_date)
                 if debt.due_date is not None and new_min > 0:
                     debt.minimum_payment = new_min
-                    next_due = debt.due_date
-                    while next_due <= current_date:
-                        next_due = _add_month(next_due)
+                    next_due = _month_step_after(debt.due_date, current_date)
 
                     inserted = False
                     for j in range(i, len(events)):
@@ -324,7 +456,7 @@ def daily_avalanche_schedule(
                         if (
                             future_ev.date == next_due
                             and future_ev.type == "debt_min"
-                            and (future_ev.debt or future_ev.name) == debt.name
+                            and future_ev.debt_idx == ev.debt_idx
                         ):
                             future_ev.amount = new_min
                             inserted = True
@@ -338,6 +470,7 @@ def daily_avalanche_schedule(
                                     amount=new_min,
                                     name=debt.name,
                                     debt=debt.name,
+                                    debt_idx=ev.debt_idx,
                                 ),
                             )
                             inserted = True
@@ -350,96 +483,118 @@ def daily_avalanche_schedule(
                                 amount=new_min,
                                 name=debt.name,
                                 debt=debt.name,
+                                debt_idx=ev.debt_idx,
                             )
                         )
 
-                schedule.append(
-                    {
-                        "date": ev.date,
-                        "type": ev.type,
-                        "description": ev.name,
-                        "amount": ev.amount,
-                        "balance": balance,
-                    }
-                )
+                day_rows.append((ev, ev.amount, _ZERO))
                 continue
 
             payment_amount = ev.amount
             if ev.type == "debt_min":
-                debt = debt_lookup[ev.debt or ev.name]
+                debt = debts[ev.debt_idx]
                 payment_amount = min(ev.amount, debt.balance)
                 if payment_amount <= 0:
                     continue
                 debt.balance -= payment_amount
                 if debt.balance <= 0 and debt.paid_off_date is None:
                     debt.paid_off_date = ev.date
-            balance -= payment_amount
-            if balance < 0:
-                if not debug:
-                    raise ValueError(
-                        f"Balance would go negative on {ev.date}"  # pragma: no cover - string only
-                    )
-                if negative_hit is None:
-                    negative_hit = ev.date
-            schedule.append(
+            day_rows.append((ev, -payment_amount, -payment_amount))
+
+        if day_rows:
+            running = list(
+                accumulate((delta for _, _, delta in day_rows), initial=balance)
+            )[1:]
+            for (ev, _, _), row_balance in zip(day_rows, running):
+                if row_balance < 0 and ev.type not in ("paycheck", "debt_add"):
+                    if not debug:
+                        raise ValueError(
+                            f"Balance would go negative on {ev.date}"  # pragma: no cover - string only
+                        )
+                    if negative_hit is None:
+                        negative_hit = ev.date
+                    break
+            schedule.extend(
                 {
                     "date": ev.date,
                     "type": ev.type,
                     "description": ev.name,
-                    "amount": -payment_amount,
-                    "balance": balance,
+                    "amount": amount,
+                    "balance": row_balance,
                 }
+                for (ev, amount, _), row_balance in zip(day_rows, running)
             )
-
-        # Future events for safe-payment calculation
-        future_events = events[i:]
-
-        # Build future bills and incomes while accounting for upcoming debt
-        # additions that will increase minimum payments before those payments
-        # are due.
-        future_bills: List[dict] = []
-        future_incomes: List[dict] = []
-        simulated_balances = {d.name: d.balance for d in debts}
-        pending_min: dict[str, Decimal] = {}
-        last_sim_date = current_date
-        for fev in future_events:
-            # Accrue interest on simulated balances up to this event
-            delta_days = (fev.date - last_sim_date).days
-            if delta_days > 0:
-                for name, bal in simulated_balances.items():
-                    apr = debt_lookup[name].apr
-                    if bal > 0 and apr > 0:
-                        simulated_balances[name] += bal * apr / Decimal("36500") * delta_days
-                last_sim_date = fev.date
-            if fev.type == "paycheck":
-                future_incomes.append({"amount": fev.amount, "date": fev.date.isoformat()})
-                continue
-            if fev.type == "debt_add":
-                simulated_balances[fev.debt] += fev.amount
-                temp_debt = Debt(
-                    name=fev.debt,
-                    balance=simulated_balances[fev.debt],
-                    apr=debt_lookup[fev.debt].apr,
-                    minimum_payment=Decimal("0"),
-                    due_date=debt_lookup[fev.debt].due_date,
-                )
-                pending_min[fev.debt] = compute_min_payment(temp_debt, fev.date)
-                continue
-            if fev.type == "debt_min":
-                name = fev.debt or fev.name
-                if simulated_balances[name] <= 0:
+            balance = running[-1]
+
+        if debts:
+            # Future events for safe-payment calculation
+            future_events = events[i:]
+
+            # Build future bill and income flows while accounting for upcoming
+            # debt additions that will increase minimum payments before those
+            # payments are due.
+            outflows: List[Tuple[date, Decimal]] = []
+            inflows: List[Tuple[date, Decimal]] = []
+            simulated_balances = [d.balance for d in debts]
+            pending_min: dict[int, Decimal] = {}
+            last_sim_ord = current_date.toordinal()
+            for fev in future_events:
+                # Accrue interest on simulated balances up to this event
+                fev_ord = fev.date.toordinal()
+                delta_days = fev_ord - last_sim_ord
+                if delta_days > 0:
+                    for idx, _, rate in accruing:
+                        bal = simulated_balances[idx]
+                        if bal > 0:
+                            simulated_balances[idx] += bal * rate * delta_days
+                    last_sim_ord = fev_ord
+                if fev.type == "paycheck":
+                    inflows.append((fev.date, fev.amount))
+                    continue
+                if fev.type == "debt_add":
+                    idx = fev.debt_idx
+                    simulated_balances[idx] += fev.amount
+                    temp_debt = Debt(
+                        name=fev.debt,
+                        balance=simulated_balances[idx],
+                        apr=debts[idx].apr,
+                        minimum_payment=_ZERO,
+                        due_date=debts[idx].due_date,
+                    )
+                    pending_min[idx] = compute_min_payment(temp_debt, fev.date)
                     continue
-                amount = pending_min.pop(name, fev.amount)
-                future_bills.append({"amount": amount, "date": fev.date.isoformat()})
-                simulated_balances[name] = max(
-                    Decimal("0"), simulated_balances[name] - amount
+                if fev.type == "debt_min":
+                    idx = fev.debt_idx
+                    if simulated_balances[idx] <= 0:
+                        continue
+                    amount = pending_min.pop(idx, fev.amount)
+                    outflows.append((fev.date, -amount))
+                    simulated_balances[idx] = max(
+                        _ZERO, simulated_balances[idx] - amount
+                    )
+                    continue
+                outflows.append((fev.date, -fev.amount))
+
+            lookahead = outflows + inflows
+            lookahead.sort(key=_flow_key)
+            min_balance, negative_date = min_running_balance(balance, lookahead)
+        else:
+            # No debts: the lookahead is a suffix minimum of running totals
+            while k < len(flows) and flows[k][0] <= current_date:
+                k += 1
+            base = totals[k]
+            min_balance = balance + (suffix_min[k] - base)
+            negative_date = None
+            if min_balance < 0:
+                negative_date = next(
+                    (
+                        flow_date
+                        for (flow_date, _), total in zip(flows[k:], totals[k + 1 :])
+                        if balance + (total - base) < 0
+                    ),
+                    None,
                 )
-                continue
-            future_bills.append({"amount": fev.amount, "date": fev.date.isoformat()})
 
-        min_balance, negative_date = projected_min_balance(
-            balance, future_bills, future_incomes
-        )
         if negative_date is not None and negative_date <= end:
             if not debug:
                 raise ValueError(
@@ -447,12 +602,11 @@ def daily_avalanche_schedule(
                 )
             if negative_hit is None:
                 negative_hit = negative_date
-        safe = max(Decimal("0"), min_balance)
+        safe = max(_ZERO, min_balance)
 
         if safe > 0:
-            active_debts = [d for d in debts if d.balance > 0]
-            if active_debts:
-                target = max(active_debts, key=lambda d: d.apr)
+            target = next((d for d in avalanche_order if d.balance > 0), None)
+            if target is not None:
                 payment = min(safe, target.balance)
                 if payment > 0:
                     target.balance -= payment
@@ -470,9 +624,9 @@ def daily_avalanche_schedule(
                     )
 
         # Accrue daily interest on all debts at end of day
-        for debt in debts:
-            if debt.balance > 0 and debt.apr > 0:
-                interest = debt.balance * debt.apr / Decimal("36500")
+        for _, debt, rate in accruing:
+            if debt.balance > 0:
+                interest = debt.balance * rate
                 debt.balance += interest
                 debt.interest_accrued += interest
 
@@ -10,7 +10,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Iterable, List
+from itertools import accumulate
+from typing import Iterable, List, Sequence, Tuple
 
 
 @dataclass
@@ -29,6 +30,16 @@ def _parse_date(value: date | str) -> date:
     return datetime.strptime(value, "%Y-%m-%d").date()
 
 
+def _to_dec(value: Decimal | int | float | str) -> Decimal:
+    """Convert an amount to ``Decimal``, only formatting floats through ``str``."""
+
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
 def _build_events(bills: Iterable[dict], incomes: Iterable[dict]) -> List[CashEvent]:
     """Convert bill and income dictionaries into ``CashEvent`` objects."""
 
@@ -37,42 +48,62 @@ def _build_events(bills: Iterable[dict], incomes: Iterable[dict]) -> List[CashEv
         events.append(
             CashEvent(
                 date=_parse_date(item["date"]),
-                amount=Decimal(str(item["amount"])) * Decimal("-1"),
+                amount=-_to_dec(item["amount"]),
             )
         )
     for item in incomes:
         events.append(
             CashEvent(
                 date=_parse_date(item["date"]),
-                amount=Decimal(str(item["amount"])),
+                amount=_to_dec(item["amount"]),
             )
         )
-    # Sort by date; on same day, incomes (positive) should apply before bills
-    events.sort(key=lambda e: (e.date, e.amount < 0))
+    events.sort(key=lambda e: _flow_key((e.date, e.amount)))
     return events
 
 
-def projected_min_balance(
-    initial_balance: float | Decimal, bills: Iterable[dict], incomes: Iterable[dict]
+def _flow_key(flow: Tuple[date, Decimal]) -> Tuple[date, bool]:
+    """Order cash flows by date with incomes ahead of bills on the same day.
+
+    ``min_running_balance`` expects its flows in this order.
+    """
+
+    return flow[0], flow[1] < 0
+
+
+def min_running_balance(
+    initial_balance: Decimal, flows: Sequence[Tuple[date, Decimal]]
 ) -> tuple[Decimal, date | None]:
-    """Return the minimum projected balance and when it occurs."""
+    """Return the lowest running balance and the first date it goes negative.
 
-    balance = Decimal(str(initial_balance))
-    events = _build_events(bills, incomes)
+    ``flows`` are ``(date, amount)`` pairs already in the order they apply,
+    with positive amounts for income and negative amounts for bills. This is
+    the inner loop of the projection and does no parsing or conversion.
+    """
 
-    running = balance
-    min_balance = running
+    # Prefix sums of the flow amounts give the balance after each flow
+    running = list(accumulate((amount for _, amount in flows), initial=initial_balance))
+    min_balance = min(running)
     negative_date = None
-    for event in events:
-        running += event.amount
-        if running < min_balance:
-            min_balance = running
-        if negative_date is None and running < 0:
-            negative_date = event.date
+    if min_balance < 0:
+        negative_date = next(
+            (flow_date for (flow_date, _), bal in zip(flows, running[1:]) if bal < 0),
+            None,
+        )
 
     return min_balance, negative_date
 
 
+def projected_min_balance(
+    initial_balance: float | Decimal, bills: Iterable[dict], incomes: Iterable[dict]
+) -> tuple[Decimal, date | None]:
+    """Return the minimum projected balance and when it occurs."""
+
+    balance = _to_dec(initial_balance)
+    events = _build_events(bills, incomes)
+    return min_running_balance(balance, [(e.date, e.amount) for e in events])
+
+
 def max_safe_payment(initial_balance: float | Decimal, bills: Iterable[dict], incomes: Iterable[dict]) -> Decimal:
     """Return the largest amount that can be paid today without future overdraft.
 
@@ -1,251 +1,528 @@
 """Command-line interface for managing finances and running simulations."""
 
 from collections import defaultdict
+from datetime import date
 from decimal import Decimal
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+import hashlib
 import json
-from typing import Dict, List
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from typing import Dict, List, Optional
 
 from avalanche import daily_avalanche_schedule
 
+try:  # Optional C-accelerated JSON; the stdlib module is used otherwise
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed packages
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+else:  # pragma: no cover - depends on installed packages
+    _loads = json.loads
+
+    def _dumps(data: Dict) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
 
 DATA_FILE = Path(__file__).with_name("financial_data.json")
 
+# Last read or saved bytes of DATA_FILE, keyed by its modification time
+_CACHE: Dict = {"mtime": None, "raw": None}
+
 
 def load_data() -> Dict:
-    """Load financial data from ``financial_data.json``."""
-    if DATA_FILE.exists():
-        with DATA_FILE.open() as f:
-            return json.load(f)
-    return {"paychecks": [], "bills": [], "debts": [], "goals": []}
+    """Load financial data from ``financial_data.json``.
+
+    The file's bytes are reused while its modification time is unchanged,
+    so repeated loads do not touch the disk. Each call parses a fresh dict,
+    so unsaved changes a caller makes are never seen by later loads.
+    """
+    try:
+        mtime = DATA_FILE.stat().st_mtime_ns
+        if _CACHE["mtime"] != mtime:
+            _CACHE.update(mtime=mtime, raw=DATA_FILE.read_bytes())
+    except FileNotFoundError:
+        return {"paychecks": [], "bills": [], "debts": [], "goals": []}
+    return _loads(_CACHE["raw"])
 
 
 def save_data(data: Dict) -> None:
-    """Persist financial data to disk, including optional debt links."""
-    with DATA_FILE.open("w") as f:
-        json.dump(data, f, indent=2)
+    """Persist financial data to disk, including optional debt links.
+
+    The data is written to a temporary file beside the real data file (the
+    target of ``DATA_FILE`` if it is a symlink), flushed to disk and then
+    moved into place, so an interrupted save or a power loss never leaves a
+    truncated data file behind. The existing file's permissions are kept.
+    """
+    payload = _dumps(data)
+    target = DATA_FILE.resolve()
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name)
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(payload)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        # ``data`` was not written, so the next load must re-read the file
+        _CACHE.update(mtime=None, raw=None)
+        raise
+    _CACHE.update(mtime=DATA_FILE.stat().st_mtime_ns, raw=payload)
 
 
 # ---------------------------------------------------------------------------
 # Editing helpers
 
 
+def _ask(prompt: str = "") -> str:
+    """Prompt for a line of input without the overhead of ``input()``.
+
+    Raises ``EOFError`` once standard input is exhausted, as ``input()`` does.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def _parse_idx(text: str, count: int) -> Optional[int]:
+    """Return the zero-based position for a 1-based menu ``text``, if valid."""
+    try:
+        i = int(text) - 1
+    except ValueError:
+        return None
+    return i if 0 <= i < count else None
+
+
 def _delete_item(items: List[dict]) -> None:
-    idx = input("Number to delete: ").strip()
-    if idx.isdigit() and 1 <= int(idx) <= len(items):
-        del items[int(idx) - 1]
+    i = _parse_idx(_ask("Number to delete: ").strip(), len(items))
+    if i is not None:
+        del items[i]
 
 
 def edit_paychecks(data: Dict) -> None:
     """Add or remove recurring income entries."""
     paychecks = data.setdefault("paychecks", [])
-    while True:
-        print("\nCurrent paychecks:")
-        for i, p in enumerate(paychecks, 1):
-            freq = p.get("frequency", "monthly")
-            print(f"{i}. {p['name']} ${p['amount']} starting {p['date']} ({freq})")
-        action = input("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
-        if action == "a":
-            name = input("Name: ").strip() or "Paycheck"
-            amount = float(input("Amount: ").strip())
-            date = input("First date (YYYY-MM-DD): ").strip()
-            freq = input("Frequency [monthly]: ").strip() or "monthly"
-            paychecks.append(
-                {"name": name, "amount": amount, "date": date, "frequency": freq}
-            )
-            save_data(data)
-        elif action == "e":
-            idx = input("Number to edit: ").strip()
-            if idx.isdigit() and 1 <= int(idx) <= len(paychecks):
-                p = paychecks[int(idx) - 1]
-                name = input(f"Name [{p['name']}]: ").strip() or p['name']
-                amount = input(f"Amount [{p['amount']}]: ").strip()
-                date = input(f"First date (YYYY-MM-DD) [{p['date']}]: ").strip() or p['date']
-                freq = input(
-                    f"Frequency [{p.get('frequency', 'monthly')}]: "
-                ).strip() or p.get("frequency", "monthly")
-                if amount:
-                    p['amount'] = float(amount)
-                p.update({"name": name, "date": date, "frequency": freq})
-                save_data(data)
-        elif action == "d":
-            _delete_item(paychecks)
+    dirty = False
+    try:
+        while True:
+            print("\nCurrent paychecks:")
+            for i, p in enumerate(paychecks, 1):
+                freq = p.get("frequency", "monthly")
+                print(f"{i}. {p['name']} ${p['amount']} starting {p['date']} ({freq})")
+            action = _ask("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
+            if action == "a":
+                name = _ask("Name: ").strip() or "Paycheck"
+                amount = float(_ask("Amount: ").strip())
+                date = _ask("First date (YYYY-MM-DD): ").strip()
+                freq = _ask("Frequency [monthly]: ").strip() or "monthly"
+                paychecks.append(
+                    {"name": name, "amount": amount, "date": date, "frequency": freq}
+                )
+                dirty = True
+            elif action == "e":
+                i = _parse_idx(_ask("Number to edit: ").strip(), len(paychecks))
+                if i is not None:
+                    p = paychecks[i]
+                    name = _ask(f"Name [{p['name']}]: ").strip() or p['name']
+                    amount = _ask(f"Amount [{p['amount']}]: ").strip()
+                    date = _ask(f"First date (YYYY-MM-DD) [{p['date']}]: ").strip() or p['date']
+                    freq = _ask(
+                        f"Frequency [{p.get('frequency', 'monthly')}]: "
+                    ).strip() or p.get("frequency", "monthly")
+                    amount = float(amount) if amount else p['amount']
+                    p.update(
+                        {"name": name, "amount": amount, "date": date, "frequency": freq}
+                    )
+                    dirty = True
+            elif action == "d":
+                _delete_item(paychecks)
+                dirty = True
+            elif action == "b":
+                break
+    finally:
+        if dirty:
             save_data(data)
-        elif action == "b":
-            break
 
 
 def edit_bills(data: Dict) -> None:
     """Add or remove bill entries."""
     bills = data.setdefault("bills", [])
     debts = data.get("debts", [])
-    while True:
-        print("\nCurrent bills:")
-        for i, b in enumerate(bills, 1):
-            debt_info = f" (debt: {b['debt']})" if b.get("debt") else ""
-            print(f"{i}. {b['name']} ${b['amount']} due {b['date']}{debt_info}")
-        action = input("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
-        if action == "a":
-            name = input("Name: ").strip() or "Bill"
-            amount = float(input("Amount: ").strip())
-            date = input("Due date (YYYY-MM-DD): ").strip()
-            debt = None
-            if debts:
-                while True:
-                    print("Associate with debt? (0 for none)")
-                    for i, d in enumerate(debts, 1):
-                        print(f"{i}. {d['name']}")
-                    choice = input("Debt number [0]: ").strip()
-                    if not choice or choice == "0":
-                        break
-                    if choice.isdigit() and 1 <= int(choice) <= len(debts):
-                        debt = debts[int(choice) - 1]["name"]
-                        break
-                    print("Invalid selection. Please try again.")
-            bill = {"name": name, "amount": amount, "date": date}
-            if debt:
-                bill["debt"] = debt
-            bills.append(bill)
-            save_data(data)
-        elif action == "e":
-            idx = input("Number to edit: ").strip()
-            if idx.isdigit() and 1 <= int(idx) <= len(bills):
-                b = bills[int(idx) - 1]
-                name = input(f"Name [{b['name']}]: ").strip() or b['name']
-                amount = input(f"Amount [{b['amount']}]: ").strip()
-                date = input(f"Due date (YYYY-MM-DD) [{b['date']}]: ").strip() or b['date']
-                b.update({"name": name, "date": date})
-                if amount:
-                    b['amount'] = float(amount)
+    # 1-based menu position of each debt name; the first debt with a name wins
+    debt_positions: Dict[str, int] = {}
+    for i, d in enumerate(debts, 1):
+        debt_positions.setdefault(d["name"], i)
+    dirty = False
+    try:
+        while True:
+            print("\nCurrent bills:")
+            for i, b in enumerate(bills, 1):
+                debt_info = f" (debt: {b['debt']})" if b.get("debt") else ""
+                print(f"{i}. {b['name']} ${b['amount']} due {b['date']}{debt_info}")
+            action = _ask("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
+            if action == "a":
+                name = _ask("Name: ").strip() or "Bill"
+                amount = float(_ask("Amount: ").strip())
+                date = _ask("Due date (YYYY-MM-DD): ").strip()
+                debt = None
                 if debts:
                     while True:
                         print("Associate with debt? (0 for none)")
                         for i, d in enumerate(debts, 1):
                             print(f"{i}. {d['name']}")
-                        current = next(
-                            (i + 1 for i, d in enumerate(debts) if d['name'] == b.get('debt')),
-                            0,
-                        )
-                        choice = input(f"Debt number [{current}]: ").strip()
-                        if not choice:
-                            choice = str(current)
-                        if choice == "0":
-                            b.pop("debt", None)
+                        choice = _ask("Debt number [0]: ").strip()
+                        if not choice or choice == "0":
                             break
-                        if choice.isdigit() and 1 <= int(choice) <= len(debts):
-                            b["debt"] = debts[int(choice) - 1]["name"]
+                        i = _parse_idx(choice, len(debts))
+                        if i is not None:
+                            debt = debts[i]["name"]
                             break
                         print("Invalid selection. Please try again.")
-                save_data(data)
-        elif action == "d":
-            _delete_item(bills)
+                bill = {"name": name, "amount": amount, "date": date}
+                if debt:
+                    bill["debt"] = debt
+                bills.append(bill)
+                dirty = True
+            elif action == "e":
+                i = _parse_idx(_ask("Number to edit: ").strip(), len(bills))
+                if i is not None:
+                    b = bills[i]
+                    name = _ask(f"Name [{b['name']}]: ").strip() or b['name']
+                    amount = _ask(f"Amount [{b['amount']}]: ").strip()
+                    date = _ask(f"Due date (YYYY-MM-DD) [{b['date']}]: ").strip() or b['date']
+                    amount = float(amount) if amount else b['amount']
+                    debt = b.get("debt")
+                    if debts:
+                        current = debt_positions.get(debt, 0)
+                        while True:
+                            print("Associate with debt? (0 for none)")
+                            for i, d in enumerate(debts, 1):
+                                print(f"{i}. {d['name']}")
+                            choice = _ask(f"Debt number [{current}]: ").strip()
+                            if not choice:
+                                choice = str(current)
+                            if choice == "0":
+                                debt = None
+                                break
+                            i = _parse_idx(choice, len(debts))
+                            if i is not None:
+                                debt = debts[i]["name"]
+                                break
+                            print("Invalid selection. Please try again.")
+                    # Apply the edit only once every answer is valid
+                    b.update({"name": name, "amount": amount, "date": date})
+                    if debt:
+                        b["debt"] = debt
+                    else:
+                        b.pop("debt", None)
+                    dirty = True
+            elif action == "d":
+                _delete_item(bills)
+                dirty = True
+            elif action == "b":
+                break
+    finally:
+        if dirty:
             save_data(data)
-        elif action == "b":
-            break
 
 
 def edit_debts(data: Dict) -> None:
     """Add or remove debt entries."""
     debts = data.setdefault("debts", [])
-    while True:
-        print("\nCurrent debts:")
-        for i, d in enumerate(debts, 1):
-            print(
-                f"{i}. {d['name']} balance ${d['balance']} min ${d['minimum_payment']} APR {d['apr']} due {d['due_date']}"
-            )
-        action = input("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
-        if action == "a":
-            name = input("Name: ").strip() or "Debt"
-            balance = float(input("Balance: ").strip())
-            minimum = float(input("Minimum payment: ").strip())
-            apr = float(input("APR: ").strip())
-            due = input("Next due date (YYYY-MM-DD): ").strip()
-            debts.append(
-                {
-                    "name": name,
-                    "balance": balance,
-                    "minimum_payment": minimum,
-                    "apr": apr,
-                    "due_date": due,
-                }
-            )
-            save_data(data)
-        elif action == "e":
-            idx = input("Number to edit: ").strip()
-            if idx.isdigit() and 1 <= int(idx) <= len(debts):
-                d = debts[int(idx) - 1]
-                name = input(f"Name [{d['name']}]: ").strip() or d['name']
-                balance = input(f"Balance [{d['balance']}]: ").strip()
-                minimum = input(f"Minimum payment [{d['minimum_payment']}]: ").strip()
-                apr = input(f"APR [{d['apr']}]: ").strip()
-                due = input(
-                    f"Next due date (YYYY-MM-DD) [{d.get('due_date', '')}]: "
-                ).strip() or d.get("due_date", "")
-                if balance:
-                    d['balance'] = float(balance)
-                if minimum:
-                    d['minimum_payment'] = float(minimum)
-                if apr:
-                    d['apr'] = float(apr)
-                d.update({"name": name, "due_date": due})
-                save_data(data)
-        elif action == "d":
-            _delete_item(debts)
+    dirty = False
+    try:
+        while True:
+            print("\nCurrent debts:")
+            for i, d in enumerate(debts, 1):
+                print(
+                    f"{i}. {d['name']} balance ${d['balance']} min ${d['minimum_payment']} APR {d['apr']} due {d['due_date']}"
+                )
+            action = _ask("A)dd, E)dit, D)elete, B)ack: ").strip().lower()
+            if action == "a":
+                name = _ask("Name: ").strip() or "Debt"
+                balance = float(_ask("Balance: ").strip())
+                minimum = float(_ask("Minimum payment: ").strip())
+                apr = float(_ask("APR: ").strip())
+                due = _ask("Next due date (YYYY-MM-DD): ").strip()
+                debts.append(
+                    {
+                        "name": name,
+                        "balance": balance,
+                        "minimum_payment": minimum,
+                        "apr": apr,
+                        "due_date": due,
+                    }
+                )
+                dirty = True
+            elif action == "e":
+                i = _parse_idx(_ask("Number to edit: ").strip(), len(debts))
+                if i is not None:
+                    d = debts[i]
+                    name = _ask(f"Name [{d['name']}]: ").strip() or d['name']
+                    balance = _ask(f"Balance [{d['balance']}]: ").strip()
+                    minimum = _ask(f"Minimum payment [{d['minimum_payment']}]: ").strip()
+                    apr = _ask(f"APR [{d['apr']}]: ").strip()
+                    due = _ask(
+                        f"Next due date (YYYY-MM-DD) [{d.get('due_date', '')}]: "
+                    ).strip() or d.get("due_date", "")
+                    balance = float(balance) if balance else d['balance']
+                    minimum = float(minimum) if minimum else d['minimum_payment']
+                    apr = float(apr) if apr else d['apr']
+                    d.update(
+                        {
+                            "name": name,
+                            "balance": balance,
+                            "minimum_payment": minimum,
+                            "apr": apr,
+                            "due_date": due,
+                        }
+                    )
+                    dirty = True
+            elif action == "d":
+                _delete_item(debts)
+                dirty = True
+            elif action == "b":
+                break
+    finally:
+        if dirty:
             save_data(data)
-        elif action == "b":
-            break
 
 
 def edit_goals(data: Dict) -> None:
     """Add, remove, or toggle goal entries (for wants and goals)."""
     goals = data.setdefault("goals", [])
     print("\nThis feature is for wants and goals.")
-    while True:
-        print("\nCurrent goals:")
-        for i, g in enumerate(goals, 1):
-            status = "enabled" if g.get("enabled", True) else "disabled"
-            print(
-                f"{i}. {g['name']} ${g['amount']} target {g['date']} ({status})"
-            )
-        action = input("A)dd, E)dit, D)elete, T)oggle, B)ack: ").strip().lower()
-        if action == "a":
-            name = input("Name: ").strip() or "Goal"
-            amount = float(input("Amount: ").strip())
-            date = input("Target date (YYYY-MM-DD): ").strip()
-            goals.append(
-                {"name": name, "amount": amount, "date": date, "enabled": True}
-            )
-            save_data(data)
-        elif action == "e":
-            idx = input("Number to edit: ").strip()
-            if idx.isdigit() and 1 <= int(idx) <= len(goals):
-                g = goals[int(idx) - 1]
-                name = input(f"Name [{g['name']}]: ").strip() or g['name']
-                amount = input(f"Amount [{g['amount']}]: ").strip()
-                date = input(
-                    f"Target date (YYYY-MM-DD) [{g['date']}]: "
-                ).strip() or g['date']
-                g.update({"name": name, "date": date})
-                if amount:
-                    g["amount"] = float(amount)
-                save_data(data)
-        elif action == "d":
-            _delete_item(goals)
+    dirty = False
+    try:
+        while True:
+            print("\nCurrent goals:")
+            for i, g in enumerate(goals, 1):
+                status = "enabled" if g.get("enabled", True) else "disabled"
+                print(
+                    f"{i}. {g['name']} ${g['amount']} target {g['date']} ({status})"
+                )
+            action = _ask("A)dd, E)dit, D)elete, T)oggle, B)ack: ").strip().lower()
+            if action == "a":
+                name = _ask("Name: ").strip() or "Goal"
+                amount = float(_ask("Amount: ").strip())
+                date = _ask("Target date (YYYY-MM-DD): ").strip()
+                goals.append(
+                    {"name": name, "amount": amount, "date": date, "enabled": True}
+                )
+                dirty = True
+            elif action == "e":
+                i = _parse_idx(_ask("Number to edit: ").strip(), len(goals))
+                if i is not None:
+                    g = goals[i]
+                    name = _ask(f"Name [{g['name']}]: ").strip() or g['name']
+                    amount = _ask(f"Amount [{g['amount']}]: ").strip()
+                    date = _ask(
+                        f"Target date (YYYY-MM-DD) [{g['date']}]: "
+                    ).strip() or g['date']
+                    amount = float(amount) if amount else g['amount']
+                    g.update({"name": name, "amount": amount, "date": date})
+                    dirty = True
+            elif action == "d":
+                _delete_item(goals)
+                dirty = True
+            elif action == "t":
+                i = _parse_idx(_ask("Number to toggle: ").strip(), len(goals))
+                if i is not None:
+                    g = goals[i]
+                    g["enabled"] = not g.get("enabled", True)
+                    dirty = True
+            elif action == "b":
+                break
+    finally:
+        if dirty:
             save_data(data)
-        elif action == "t":
-            idx = input("Number to toggle: ").strip()
-            if idx.isdigit() and 1 <= int(idx) <= len(goals):
-                g = goals[int(idx) - 1]
-                g["enabled"] = not g.get("enabled", True)
-                save_data(data)
-        elif action == "b":
-            break
 
 
 # ---------------------------------------------------------------------------
 # Simulation
 
 
+# Summary categories in print order, with their labels
+_CAT_LABELS = {
+    "paycheck": "Income",
+    "bill": "Bills",
+    "goal": "Goals",
+    "debt_min": "Debt minimums",
+    "extra": "Extra",
+    "debt_add": "Debt additions",
+}
+
+_DATE_ITEM = itemgetter("date")
+_ROW_FIELDS = itemgetter("type", "description", "amount")
+
+
+def _default_sim_cache_dir() -> Optional[Path]:
+    """Return the summary cache directory, or ``None`` if there is no home."""
+    try:
+        return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "fin"
+    except (KeyError, RuntimeError):
+        return None
+
+
+# Rendered summaries of today's simulations, keyed by a hash of their inputs
+_SIM_CACHE_DIR = _default_sim_cache_dir()
+
+
+# Modules whose code determines a simulation's rendered output
+_SIM_SOURCES = ("fin.py", "avalanche.py", "cash_flow.py")
+
+
+@lru_cache(maxsize=None)
+def _code_digest() -> str:
+    """Return a hash of the simulation code, so edits invalidate the cache."""
+    h = hashlib.blake2b(digest_size=8)
+    for name in _SIM_SOURCES:
+        h.update(Path(__file__).with_name(name).read_bytes())
+    return h.hexdigest()
+
+
+def _sim_cache_path(*inputs) -> Optional[Path]:
+    """Return the summary cache file for a simulation run on ``inputs``.
+
+    Schedules start from today's date, so entries live in a directory named
+    after it; the key also covers the simulation code itself. Returns
+    ``None`` when there is no cache directory or the code cannot be read.
+    """
+    if _SIM_CACHE_DIR is None:
+        return None
+    try:
+        digest = _code_digest()
+    except OSError:
+        return None
+    raw = json.dumps([digest, *inputs], sort_keys=True, default=str).encode()
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return _SIM_CACHE_DIR / date.today().isoformat() / f"{key}.txt"
+
+
+def _store_summary(path: Path, summary: str) -> None:
+    """Cache ``summary`` at ``path`` and prune entries from other days.
+
+    The entry is written to a temporary file and moved into place, so a
+    failed or interrupted write never leaves a partial summary to be read.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(summary)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        for old in _SIM_CACHE_DIR.iterdir():
+            if old != path.parent:
+                if old.is_dir():
+                    shutil.rmtree(old, ignore_errors=True)
+                else:
+                    old.unlink()
+    except (OSError, UnicodeError):
+        pass  # caching is best effort
+
+
+def _cents(value: Decimal) -> int:
+    """Return ``value`` as whole cents, rounded the way ``:.2f`` rounds."""
+    return int(value.scaleb(2).to_integral_value())
+
+
+def _format_cents(cents: int) -> str:
+    """Format whole cents as a dollar amount with two decimals."""
+    dollars, rem = divmod(abs(cents), 100)
+    return f"{'-' if cents < 0 else ''}{dollars}.{rem:02d}"
+
+
+def summarize_schedule(
+    schedule: List[dict],
+    debts_after: List[dict],
+    days: int,
+    negative_hit=None,
+    debt_log=None,
+) -> str:
+    """Render a simulation result as the text printed by ``run_simulation``.
+
+    Each day lists its closing balance and its itemized entries per category,
+    followed by the remaining balance of every debt.
+    """
+    # The debt log holds one entry per simulated day starting at its first date
+    log_start = debt_log[0]["date"] if debt_log else None
+
+    # The scheduler emits rows in date order, so each day's events can be
+    # grouped and rendered in one streaming pass; only the itemized entries
+    # per category and the closing balance of each day are shown.
+    lines = []
+    for day, evs in groupby(schedule, key=_DATE_ITEM):
+        names = defaultdict(list)
+        for ev in evs:
+            typ, desc, amount = _ROW_FIELDS(ev)
+            names[typ].append((desc, _cents(amount)))
+        balance = ev["balance"]
+        marker = " <<< LOW BALANCE" if negative_hit and day == negative_hit else ""
+        parts = [f"{day}: balance=${_format_cents(_cents(balance))}{marker}"]
+        if log_start is not None:
+            day_debts = debt_log[(day - log_start).days]["debts"]
+            debts_str = ", ".join(
+                [
+                    f"{name}=${_format_cents(_cents(bal))}"
+                    for name, bal in day_debts.items()
+                ]
+            )
+            if debts_str:
+                parts.append(f" | debts: {debts_str}")
+        lines.append("".join(parts))
+        for cat, label in _CAT_LABELS.items():
+            names_cat = names.get(cat)
+            if names_cat:
+                items = ", ".join(
+                    [f"{name} ${_format_cents(abs(amt))}" for name, amt in names_cat]
+                )
+                lines.append(f"  {label}: {items}")
+
+    lines.append(f"\nRemaining debt balances after {days} days:")
+    for d in debts_after:
+        interest = d.get("interest_accrued", Decimal("0"))
+        paid = d.get("paid_off_date")
+        if paid:
+            lines.append(
+                f"  {d['name']}: ${d['balance']:.2f} (paid off {paid.isoformat()}, total interest ${interest:.2f})",
+            )
+        else:
+            due = d.get("next_due_date")
+            due_str = due.isoformat() if due else "N/A"
+            lines.append(
+                f"  {d['name']}: ${d['balance']:.2f} (next due {due_str}, total interest ${interest:.2f})",
+            )
+
+    return "\n".join(lines) + "\n"
+
+
 def run_simulation(data: Dict, debug: bool = False) -> None:
     """Run the avalanche debt payoff simulation.
 
@@ -253,9 +530,9 @@ def run_simulation(data: Dict, debug: bool = False) -> None:
     become negative and the user may optionally log daily debt balances.
     """
     print("---  Debt Avalanche Forecaster ---")
-    days_str = input("Enter number of days to simulate [60]: ").strip()
+    days_str = _ask("Enter number of days to simulate [60]: ").strip()
     days = int(days_str) if days_str else 60
-    start_balance = Decimal(input("Enter current account balance: ").strip())
+    start_balance = Decimal(_ask("Enter current account balance: ").strip())
 
     paychecks = data.get("paychecks", [])
     bills = data.get("bills", [])
@@ -263,9 +540,10 @@ def run_simulation(data: Dict, debug: bool = False) -> None:
     goals = [g for g in data.get("goals", []) if g.get("enabled", True)]
 
     debt_log = None
+    cache_path = None
 
     if debug:
-        log_resp = input("Log debt balances each day? [y/N]: ").strip().lower()
+        log_resp = _ask("Log debt balances each day? [y/N]: ").strip().lower()
         debt_log = [] if log_resp == "y" else None
         schedule, debts_after, negative_hit = daily_avalanche_schedule(
             start_balance,
@@ -278,13 +556,22 @@ def run_simulation(data: Dict, debug: bool = False) -> None:
             debt_log=debt_log,
         )
     else:
+        cache_path = _sim_cache_path(
+            str(start_balance), paychecks, bills, debts, goals, days
+        )
+        if cache_path is not None:
+            try:
+                sys.stdout.write(cache_path.read_text(encoding="utf-8"))
+                return
+            except (OSError, UnicodeError):
+                pass
         try:
             schedule, debts_after, negative_hit = daily_avalanche_schedule(
                 start_balance, paychecks, bills, debts, goals, days=days
             )
         except ValueError as exc:
             print(f"Warning: {exc}")
-            resp = input(
+            resp = _ask(
                 "Run in debug mode to inspect the shortfall? [y/N]: "
             ).strip().lower()
             if resp != "y":
@@ -298,7 +585,7 @@ def run_simulation(data: Dict, debug: bool = False) -> None:
                 return
             err_date = datetime.strptime(m.group(1), "%Y-%m-%d").date()
             extra_days = (err_date - date.today()).days + 30
-            log_resp = input(
+            log_resp = _ask(
                 "Log debt balances each day? [y/N]: "
             ).strip().lower()
             debt_log = [] if log_resp == "y" else None
@@ -313,72 +600,14 @@ def run_simulation(data: Dict, debug: bool = False) -> None:
                 debt_log=debt_log,
             )
             days = extra_days
+            cache_path = None
 
-    # Summarize events by date
-    daily = defaultdict(
-        lambda: {
-            "paycheck": Decimal("0"),
-            "bill": Decimal("0"),
-            "goal": Decimal("0"),
-            "debt_min": Decimal("0"),
-            "extra": Decimal("0"),
-            "debt_add": Decimal("0"),
-            "names": defaultdict(list),
-            "balance": Decimal("0"),
-        }
+    summary = summarize_schedule(
+        schedule, debts_after, days, negative_hit=negative_hit, debt_log=debt_log
     )
-    for ev in schedule:
-        day = ev["date"]
-        d = daily[day]
-        if ev["type"] not in d:
-            d[ev["type"]] = Decimal("0")
-        d[ev["type"]] += ev["amount"]
-        d["names"][ev["type"]].append((ev["description"], ev["amount"]))
-        d["balance"] = ev["balance"]
-
-    debt_map = {entry["date"]: entry["debts"] for entry in debt_log} if debt_log else {}
-
-    for day in sorted(daily):
-        d = daily[day]
-        marker = " <<< LOW BALANCE" if negative_hit and day == negative_hit else ""
-        line = f"{day}: balance=${d['balance']:.2f}{marker}"
-        if debt_map:
-            debts_str = ", ".join(
-                f"{name}=${bal:.2f}" for name, bal in debt_map.get(day, {}).items()
-            )
-            if debts_str:
-                line += f" | debts: {debts_str}"
-        print(line)
-        for cat in ["paycheck", "bill", "goal", "debt_min", "extra", "debt_add"]:
-            if d["names"][cat]:
-                items = ", ".join(
-                    f"{name} ${(-amt if amt < 0 else amt):.2f}"
-                    for name, amt in d["names"][cat]
-                )
-                label = {
-                    "paycheck": "Income",
-                    "bill": "Bills",
-                    "goal": "Goals",
-                    "debt_min": "Debt minimums",
-                    "extra": "Extra",
-                    "debt_add": "Debt additions",
-                }[cat]
-                print(f"  {label}: {items}")
-
-    print(f"\nRemaining debt balances after {days} days:")
-    for d in debts_after:
-        interest = d.get("interest_accrued", Decimal("0"))
-        paid = d.get("paid_off_date")
-        if paid:
-            print(
-                f"  {d['name']}: ${d['balance']:.2f} (paid off {paid.isoformat()}, total interest ${interest:.2f})",
-            )
-        else:
-            due = d.get("next_due_date")
-            due_str = due.isoformat() if due else "N/A"
-            print(
-                f"  {d['name']}: ${d['balance']:.2f} (next due {due_str}, total interest ${interest:.2f})",
-            )
+    sys.stdout.write(summary)
+    if cache_path is not None:
+        _store_summary(cache_path, summary)
 
 
 # ---------------------------------------------------------------------------
@@ -397,7 +626,7 @@ def main() -> None:
         print("5. Run simulation")
         print("6. Run debug simulation")
         print("7. Quit")
-        choice = input("Select an option: ").strip()
+        choice = _ask("Select an option: ").strip()
         if choice == "1":
             edit_paychecks(data)
         elif choice == "2":
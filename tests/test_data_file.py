@@ -0,0 +1,100 @@
+import os
+import stat
+
+import pytest
+
+import fin
+
+
+def _use_data_file(monkeypatch, path):
+    monkeypatch.setattr(fin, "DATA_FILE", path)
+    monkeypatch.setattr(fin, "_CACHE", {"mtime": None, "raw": None})
+
+
+def test_save_keeps_file_mode(monkeypatch, tmp_path):
+    path = tmp_path / "financial_data.json"
+    path.write_text("{}")
+    path.chmod(0o644)
+    _use_data_file(monkeypatch, path)
+    fin.save_data({"paychecks": []})
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_new_file_follows_umask(monkeypatch, tmp_path):
+    path = tmp_path / "financial_data.json"
+    _use_data_file(monkeypatch, path)
+    old = os.umask(0o022)
+    try:
+        fin.save_data({"paychecks": []})
+    finally:
+        os.umask(old)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_save_writes_through_symlink(monkeypatch, tmp_path):
+    synced = tmp_path / "synced"
+    synced.mkdir()
+    real = synced / "financial_data.json"
+    real.write_text("{}")
+    link = tmp_path / "financial_data.json"
+    link.symlink_to(real)
+    _use_data_file(monkeypatch, link)
+    fin.save_data({"paychecks": [{"name": "Job"}]})
+    assert link.is_symlink()
+    assert fin._loads(real.read_bytes()) == {"paychecks": [{"name": "Job"}]}
+    assert list(synced.iterdir()) == [real]
+
+
+def test_load_after_save_does_not_reread_file(monkeypatch, tmp_path):
+    _use_data_file(monkeypatch, tmp_path / "financial_data.json")
+    data = {"paychecks": [], "bills": [], "debts": [], "goals": []}
+    fin.save_data(data)
+
+    def fail(self):
+        raise AssertionError("data file was re-read")
+
+    monkeypatch.setattr(fin.Path, "read_bytes", fail)
+    loaded = fin.load_data()
+    assert loaded == data
+    assert loaded is not data
+
+
+def test_unsaved_changes_are_not_cached(monkeypatch, tmp_path):
+    _use_data_file(monkeypatch, tmp_path / "financial_data.json")
+    fin.save_data({"bills": []})
+    fin.load_data()["bills"].append({"name": "Unsaved"})
+    assert fin.load_data() == {"bills": []}
+
+
+def test_outside_write_forces_reload(monkeypatch, tmp_path):
+    path = tmp_path / "financial_data.json"
+    _use_data_file(monkeypatch, path)
+    fin.save_data({"paychecks": []})
+    mtime = path.stat().st_mtime_ns
+    path.write_text('{"paychecks": [{"name": "Job"}]}')
+    os.utime(path, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+    assert fin.load_data() == {"paychecks": [{"name": "Job"}]}
+
+
+def test_failed_save_leaves_no_temp_file(monkeypatch, tmp_path):
+    path = tmp_path / "financial_data.json"
+    path.write_text('{"paychecks": []}')
+    _use_data_file(monkeypatch, path)
+    loaded = fin.load_data()
+    loaded["paychecks"].append({"name": "Unsaved"})
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            fin.save_data(loaded)
+    assert [p.name for p in tmp_path.iterdir()] == ["financial_data.json"]
+    # The unsaved edit must not be served from the cache
+    assert fin.load_data() == {"paychecks": []}
+
+
+def test_missing_file_returns_empty_default(monkeypatch, tmp_path):
+    _use_data_file(monkeypatch, tmp_path / "financial_data.json")
+    assert fin.load_data() == {"paychecks": [], "bills": [], "debts": [], "goals": []}
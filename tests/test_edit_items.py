@@ -1,15 +1,13 @@
-import os
+import io
 import sys
-from pathlib import Path
 
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
+import pytest
 
 import fin
 
 
 def _mock_inputs(monkeypatch, inputs):
-    it = iter(inputs)
-    monkeypatch.setattr("builtins.input", lambda _: next(it))
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(inputs) + "\n"))
     monkeypatch.setattr(fin, "save_data", lambda data: None)
 
 
@@ -104,3 +102,59 @@ def test_toggle_goal(monkeypatch):
     # Ensure details remain
     assert g["amount"] == 500.0
     assert g["date"] == "2024-12-01"
+
+
+def test_edits_saved_once_on_back(monkeypatch):
+    data = {"paychecks": []}
+    _mock_inputs(monkeypatch, [
+        "a", "Job", "1000", "2024-01-01", "",
+        "a", "Side", "200", "2024-01-15", "weekly",
+        "b",
+    ])
+    saves = []
+    monkeypatch.setattr(fin, "save_data", lambda data: saves.append(len(data["paychecks"])))
+    fin.edit_paychecks(data)
+    assert saves == [2]
+
+
+def test_delete_ignores_invalid_numbers(monkeypatch):
+    data = {"goals": [{"name": "Trip", "amount": 500.0, "date": "2024-12-01"}]}
+    _mock_inputs(monkeypatch, ["d", "0", "d", "2", "d", "x", "b"])
+    fin.edit_goals(data)
+    assert len(data["goals"]) == 1
+    _mock_inputs(monkeypatch, ["d", "1", "b"])
+    fin.edit_goals(data)
+    assert data["goals"] == []
+
+
+def test_invalid_amount_does_not_save_partial_edit(monkeypatch):
+    data = {"bills": [{"name": "Rent", "amount": 400.0, "date": "2025-02-02"}]}
+    _mock_inputs(monkeypatch, [
+        "a", "Water", "30", "2025-02-10",
+        "e", "1", "Mortgage", "abc", "",
+    ])
+    saves = []
+    monkeypatch.setattr(fin, "save_data", lambda data: saves.append(data["bills"]))
+    with pytest.raises(ValueError):
+        fin.edit_bills(data)
+    assert saves == [
+        [
+            {"name": "Rent", "amount": 400.0, "date": "2025-02-02"},
+            {"name": "Water", "amount": 30.0, "date": "2025-02-10"},
+        ]
+    ]
+
+
+def test_invalid_debt_number_leaves_debt_unchanged(monkeypatch):
+    debt = {
+        "name": "Card",
+        "balance": 100.0,
+        "minimum_payment": 10.0,
+        "apr": 5.0,
+        "due_date": "2024-01-10",
+    }
+    data = {"debts": [dict(debt)]}
+    _mock_inputs(monkeypatch, ["e", "1", "Card2", "150", "x", "", ""])
+    with pytest.raises(ValueError):
+        fin.edit_debts(data)
+    assert data["debts"] == [debt]
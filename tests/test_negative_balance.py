@@ -1,12 +1,6 @@
-import os
-import sys
 from datetime import date, timedelta
-from pathlib import Path
 import pytest
 
-# Ensure project root on path for direct module imports
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
-
 from avalanche import daily_avalanche_schedule
 
 
@@ -1,10 +1,4 @@
-import os
-import sys
 from datetime import date
-from pathlib import Path
-
-# Ensure project root on path for direct module imports
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
 
 from avalanche import daily_avalanche_schedule
 
@@ -1,11 +1,5 @@
-import os
-import sys
 from datetime import date, timedelta
 from calendar import monthrange
-from pathlib import Path
-
-# Ensure project root on path for direct module imports
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
 
 from avalanche import daily_avalanche_schedule
 
@@ -0,0 +1,120 @@
+import io
+import sys
+from datetime import date
+
+import pytest
+
+import fin
+
+
+def test_run_simulation_reuses_cached_summary(monkeypatch, capsys, tmp_path):
+    data = {
+        "paychecks": [
+            {
+                "name": "Job",
+                "amount": 1000.0,
+                "date": date.today().isoformat(),
+                "frequency": "weekly",
+            }
+        ],
+        "bills": [{"name": "Rent", "amount": 400.0, "date": date.today().isoformat()}],
+        "debts": [],
+    }
+    monkeypatch.setattr(fin, "_SIM_CACHE_DIR", tmp_path)
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("14\n100\n"))
+    fin.run_simulation(data)
+    first = capsys.readouterr().out
+    assert "Rent $400.00" in first
+
+    def fail(*args, **kwargs):
+        raise AssertionError("simulation should come from the cache")
+
+    monkeypatch.setattr(fin, "daily_avalanche_schedule", fail)
+    monkeypatch.setattr(sys, "stdin", io.StringIO("14\n100\n"))
+    fin.run_simulation(data)
+    assert capsys.readouterr().out == first
+
+    # A different starting balance is a different simulation
+    monkeypatch.setattr(sys, "stdin", io.StringIO("14\n200\n"))
+    with pytest.raises(AssertionError):
+        fin.run_simulation(data)
+
+
+def test_summary_cache_keyed_by_code_and_pruned(monkeypatch, capsys, tmp_path):
+    data = {"paychecks": [], "bills": [], "debts": []}
+    monkeypatch.setattr(fin, "_SIM_CACHE_DIR", tmp_path)
+    stale = tmp_path / "2000-01-01"
+    stale.mkdir()
+    (stale / "old.txt").write_text("stale")
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5\n100\n"))
+    fin.run_simulation(data)
+    capsys.readouterr()
+    assert [p.name for p in tmp_path.iterdir()] == [date.today().isoformat()]
+
+    # Changed simulation code must not reuse summaries from the old code
+    monkeypatch.setattr(fin, "_code_digest", lambda: "updated")
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5\n100\n"))
+    monkeypatch.setattr(fin, "daily_avalanche_schedule", lambda *a, **k: ([], [], None))
+    fin.run_simulation(data)
+    assert len(list((tmp_path / date.today().isoformat()).iterdir())) == 2
+
+
+def test_failed_cache_write_is_recomputed(monkeypatch, capsys, tmp_path):
+    data = {
+        "paychecks": [],
+        "bills": [{"name": "Café", "amount": 40.0, "date": date.today().isoformat()}],
+        "debts": [],
+    }
+    monkeypatch.setattr(fin, "_SIM_CACHE_DIR", tmp_path)
+    real_fdopen = fin.os.fdopen
+
+    class FullDisk:
+        def __init__(self, fd, *args, **kwargs):
+            self.f = real_fdopen(fd, *args, **kwargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.f.close()
+
+        def write(self, text):
+            self.f.write(text[: len(text) // 2])
+            raise OSError(28, "No space left on device")
+
+    with monkeypatch.context() as m:
+        m.setattr(fin.os, "fdopen", FullDisk)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("5\n100\n"))
+        fin.run_simulation(data)
+    first = capsys.readouterr().out
+    assert "Café $40.00" in first
+    assert list((tmp_path / date.today().isoformat()).iterdir()) == []
+
+    calls = []
+    real_schedule = fin.daily_avalanche_schedule
+
+    def schedule(*args, **kwargs):
+        calls.append(args)
+        return real_schedule(*args, **kwargs)
+
+    monkeypatch.setattr(fin, "daily_avalanche_schedule", schedule)
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5\n100\n"))
+    fin.run_simulation(data)
+    assert capsys.readouterr().out == first
+    assert len(calls) == 1
+
+
+def test_missing_home_skips_cache(monkeypatch, capsys):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(fin.Path, "home", no_home)
+    monkeypatch.setattr(fin, "_SIM_CACHE_DIR", fin._default_sim_cache_dir())
+    assert fin._SIM_CACHE_DIR is None
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5\n100\n"))
+    fin.run_simulation({"paychecks": [], "bills": [], "debts": []})
+    assert "Remaining debt balances" in capsys.readouterr().out
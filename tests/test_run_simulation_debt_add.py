@@ -1,16 +1,12 @@
-import os
+import io
 import sys
 from datetime import date
-from pathlib import Path
-
-# Ensure project root in path
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
 
 import fin
 from avalanche import daily_avalanche_schedule
 
 
-def test_run_simulation_handles_debt_add(monkeypatch, capsys):
+def test_run_simulation_handles_debt_add(monkeypatch, capsys, tmp_path):
     data = {
         "paychecks": [],
         "bills": [
@@ -31,8 +27,8 @@ def test_run_simulation_handles_debt_add(monkeypatch, capsys):
         ],
     }
 
-    inputs = iter(["1", "0"])  # simulate one day and $0 balance
-    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    monkeypatch.setattr(sys, "stdin", io.StringIO("1\n0\n"))  # simulate one day and $0 balance
+    monkeypatch.setattr(fin, "_SIM_CACHE_DIR", tmp_path)
 
     fin.run_simulation(data)
     output = capsys.readouterr().out
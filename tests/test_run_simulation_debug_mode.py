@@ -1,10 +1,6 @@
-import os
+import io
 import sys
 from datetime import date
-from pathlib import Path
-
-# Ensure project root in path
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
 
 import fin
 
@@ -22,8 +18,7 @@ def test_run_simulation_debug_mode(monkeypatch, capsys):
         "debts": [],
     }
 
-    inputs = iter(["1", "0", "n"])
-    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    monkeypatch.setattr(sys, "stdin", io.StringIO("1\n0\nn\n"))
 
     fin.run_simulation(data, debug=True)
     out = capsys.readouterr().out
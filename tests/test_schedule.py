@@ -1,11 +1,5 @@
-import os
-import sys
 from datetime import date
 from calendar import monthrange
-from pathlib import Path
-
-# Ensure the project root is on the import path
-sys.path.insert(0, os.path.abspath(os.path.join(Path(__file__).resolve().parent, "..")))
 
 from avalanche import daily_avalanche_schedule
 
@@ -40,8 +34,8 @@ def test_balances_never_negative():
 
     schedule, _, _ = daily_avalanche_schedule(0, paychecks, bills, debts)
 
-    for event in schedule:
-        assert event["balance"] >= 0, f"Negative balance {event['balance']} on {event['date']}"
+    bad = next((ev for ev in schedule if ev["balance"] < 0), None)
+    assert bad is None, f"Negative balance {bad['balance']} on {bad['date']}"
 
 
 def _add_month(d):